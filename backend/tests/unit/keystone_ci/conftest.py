@@ -0,0 +1,66 @@
+import importlib.util
+import io
+import json
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+import pytest
+
+KEYSTONE_CI_PATH = Path(__file__).resolve().parents[4] / "keystone-ci.py"
+
+
+class FakeResponse:
+    """Just enough of urllib3.HTTPResponse for KeystoneCI, preloaded or streamed"""
+
+    def __init__(
+        self,
+        status: int = 200,
+        body: Any = None,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        self.status = status
+        self.data = json.dumps(body).encode() if body is not None else b""
+        self.headers = headers or {}
+        self.released = False
+        self._stream = io.BytesIO(self.data)
+
+    def read(self, amt: int = -1) -> bytes:
+        return self._stream.read(amt)
+
+    def release_conn(self) -> None:
+        self.released = True
+
+
+class FakePool:
+    """Replays canned responses (repeating the last one) and records each request"""
+
+    def __init__(self, *responses: FakeResponse) -> None:
+        self.responses = list(responses)
+        self.requests: list[tuple[str, dict[str, str] | None]] = []
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str] | None = None,
+        **kwargs: Any,
+    ) -> FakeResponse:
+        self.requests.append((method, headers))
+        return self.responses.pop(0) if len(self.responses) > 1 else self.responses[0]
+
+    def clear(self) -> None:
+        pass
+
+
+@pytest.fixture(scope="session")
+def keystone_ci() -> ModuleType:
+    """Load keystone-ci.py, which can't be imported by name because of the hyphen"""
+    spec = importlib.util.spec_from_file_location("keystone_ci", KEYSTONE_CI_PATH)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    # dataclasses resolves the defining module through sys.modules
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
@@ -0,0 +1,106 @@
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+import pytest
+
+from tests.unit.keystone_ci.conftest import FakePool
+from tests.unit.keystone_ci.conftest import FakeResponse
+
+URL = "https://api.example.com/api/v1/suite-runs/run-1/status"
+RUNNING = {"status": "running", "total_tests": 2, "passed_tests": 1, "failed_tests": 0}
+COMPLETED = {**RUNNING, "status": "completed", "passed_tests": 2}
+
+
+@pytest.fixture
+def cache(keystone_ci: ModuleType, tmp_path: Path) -> Any:
+    return keystone_ci.StatusCache(str(tmp_path), "test-key")
+
+
+def test_terminal_status_is_always_fresh(cache: Any) -> None:
+    cache.put(URL, {}, COMPLETED)
+
+    entry = cache.get(URL)
+    assert entry["body"] == COMPLETED
+    assert cache.is_fresh(entry)
+
+
+def test_max_age_controls_freshness(cache: Any) -> None:
+    cache.put(URL, {"Cache-Control": "max-age=60"}, RUNNING)
+    assert cache.is_fresh(cache.get(URL))
+
+    cache.put(URL, {"Cache-Control": "max-age=0"}, RUNNING)
+    assert not cache.is_fresh(cache.get(URL))
+
+
+def test_etag_entry_is_stored_but_stale(cache: Any) -> None:
+    cache.put(URL, {"ETag": '"v1"'}, RUNNING)
+
+    entry = cache.get(URL)
+    assert entry["etag"] == '"v1"'
+    assert not cache.is_fresh(entry)
+
+
+def test_uncacheable_responses_are_not_stored(cache: Any) -> None:
+    """Nothing is kept for no-store, or for a running status without validators"""
+    cache.put(URL, {"Cache-Control": "no-store", "ETag": '"v1"'}, COMPLETED)
+    assert cache.get(URL) is None
+
+    cache.put(URL, {}, RUNNING)
+    assert cache.get(URL) is None
+
+
+@pytest.mark.parametrize(
+    "contents", [b"not json", b"[]", b'{"etag": "x"}', b'{"body": "x"}']
+)
+def test_malformed_entry_is_a_miss(cache: Any, contents: bytes) -> None:
+    cache.put(URL, {}, COMPLETED)
+    Path(cache._path(URL)).write_bytes(contents)
+
+    assert cache.get(URL) is None
+
+
+def test_entries_are_scoped_to_the_api_key(
+    keystone_ci: ModuleType, tmp_path: Path
+) -> None:
+    keystone_ci.StatusCache(str(tmp_path), "key-a").put(URL, {}, COMPLETED)
+
+    assert keystone_ci.StatusCache(str(tmp_path), "key-b").get(URL) is None
+    assert keystone_ci.StatusCache(str(tmp_path), "key-a").get(URL)["body"] == COMPLETED
+
+
+def test_put_leaves_no_temp_files(cache: Any, tmp_path: Path) -> None:
+    cache.put(URL, {}, COMPLETED)
+    cache.put(URL, {}, COMPLETED)
+
+    assert [p.suffix for p in tmp_path.iterdir()] == [".json"]
+
+
+def test_fetch_status_reuses_body_on_304(
+    keystone_ci: ModuleType, tmp_path: Path
+) -> None:
+    """A stale ETag entry is revalidated and its body reused when the server answers 304"""
+    client = keystone_ci.KeystoneCI("test-key", cache_dir=str(tmp_path))
+    client.pool = FakePool(
+        FakeResponse(200, RUNNING, {"ETag": '"v1"'}),
+        FakeResponse(304, headers={"ETag": '"v1"'}),
+    )
+
+    assert client._fetch_status(URL, stream=False) == RUNNING
+    assert client._fetch_status(URL, stream=False) == RUNNING
+
+    (_, first), (_, second) = client.pool.requests
+    assert first is None
+    assert second is not None
+    assert second["If-None-Match"] == '"v1"'
+
+
+def test_fetch_status_serves_terminal_entry_without_request(
+    keystone_ci: ModuleType, tmp_path: Path
+) -> None:
+    client = keystone_ci.KeystoneCI("test-key", cache_dir=str(tmp_path))
+    client.pool = FakePool(FakeResponse(200, COMPLETED))
+
+    assert client._fetch_status(URL, stream=False) == COMPLETED
+    assert client._fetch_status(URL, stream=False) == COMPLETED
+    assert len(client.pool.requests) == 1
@@ -0,0 +1,127 @@
+import time
+from types import ModuleType
+from typing import Any
+
+import pytest
+
+from tests.unit.keystone_ci.conftest import FakePool
+from tests.unit.keystone_ci.conftest import FakeResponse
+
+COMPLETED = {
+    "status": "completed",
+    "total_tests": 1,
+    "passed_tests": 1,
+    "failed_tests": 0,
+}
+
+
+def _client(keystone_ci: ModuleType, *responses: FakeResponse) -> Any:
+    client = keystone_ci.KeystoneCI("test-key", cache_dir=None)
+    client.pool = FakePool(*responses)
+    return client
+
+
+def _config(keystone_ci: ModuleType, timeout: int) -> Any:
+    return keystone_ci.RunConfig(
+        suite_ids=("suite-1",),
+        base_url="https://app.example.com",
+        timeout=timeout,
+        poll_interval=1,
+    )
+
+
+def test_poll_retries_after_retryable_status(keystone_ci: ModuleType) -> None:
+    """A 503 with Retry-After is retried by the poll loop, not raised"""
+    client = _client(
+        keystone_ci,
+        FakeResponse(503, headers={"Retry-After": "0"}),
+        FakeResponse(200, COMPLETED),
+    )
+
+    status = client.wait_for_completion("run-1", _config(keystone_ci, timeout=5))
+
+    assert status == COMPLETED
+    assert len(client.pool.requests) == 2
+
+
+def test_poll_retry_after_is_capped_by_deadline(keystone_ci: ModuleType) -> None:
+    """A Retry-After longer than the timeout doesn't stretch the wait"""
+    client = _client(keystone_ci, FakeResponse(503, headers={"Retry-After": "60"}))
+
+    start = time.monotonic()
+    with pytest.raises(TimeoutError):
+        client.wait_for_completion("run-1", _config(keystone_ci, timeout=1))
+    assert time.monotonic() - start < 5
+
+
+def test_poll_non_retryable_status_is_raised(keystone_ci: ModuleType) -> None:
+    client = _client(keystone_ci, FakeResponse(404, {"detail": "not found"}))
+
+    with pytest.raises(keystone_ci.KeystoneAPIError) as exc_info:
+        client.wait_for_completion("run-1", _config(keystone_ci, timeout=5))
+    assert exc_info.value.status == 404
+
+
+def test_trigger_retries_not_now_answers(keystone_ci: ModuleType) -> None:
+    client = _client(
+        keystone_ci,
+        FakeResponse(429, headers={"Retry-After": "0"}),
+        FakeResponse(200, {"suite_run_id": "run-1"}),
+    )
+
+    result = client.trigger_suite_run("suite-1", _config(keystone_ci, timeout=5))
+
+    assert result["suite_run_id"] == "run-1"
+    assert [method for method, _ in client.pool.requests] == ["POST", "POST"]
+
+
+def test_trigger_retry_after_is_capped_by_deadline(keystone_ci: ModuleType) -> None:
+    """A Retry-After past the timeout fails right away instead of sleeping it out"""
+    client = _client(keystone_ci, FakeResponse(429, headers={"Retry-After": "60"}))
+
+    start = time.monotonic()
+    with pytest.raises(keystone_ci.KeystoneAPIError) as exc_info:
+        client.trigger_suite_run("suite-1", _config(keystone_ci, timeout=2))
+    assert exc_info.value.status == 429
+    assert time.monotonic() - start < 1
+    assert len(client.pool.requests) == 1
+
+
+@pytest.mark.parametrize("status", [502, 504])
+def test_trigger_gateway_errors_are_not_retried(
+    keystone_ci: ModuleType, status: int
+) -> None:
+    """The run may already have been accepted behind a failing gateway"""
+    client = _client(keystone_ci, FakeResponse(status, headers={"Retry-After": "0"}))
+
+    with pytest.raises(keystone_ci.KeystoneAPIError):
+        client.trigger_suite_run("suite-1", _config(keystone_ci, timeout=5))
+    assert len(client.pool.requests) == 1
+
+
+def test_pool_retry_after_is_capped(keystone_ci: ModuleType) -> None:
+    retry = keystone_ci.CappedRetry(total=3)
+
+    long_wait = FakeResponse(503, headers={"Retry-After": "3600"})
+    short_wait = FakeResponse(503, headers={"Retry-After": "2"})
+    assert retry.get_retry_after(long_wait) == keystone_ci.RETRY_AFTER_MAX
+    assert retry.get_retry_after(short_wait) == 2
+    assert retry.get_retry_after(FakeResponse(503)) is None
+
+
+@pytest.mark.parametrize("status", [400, 422, 501])
+def test_long_poll_rejection_falls_back_to_interval_polling(
+    keystone_ci: ModuleType, status: int
+) -> None:
+    """Servers that reject `?wait=` are polled at intervals instead of failing the run"""
+    client = _client(
+        keystone_ci,
+        FakeResponse(status, {"detail": "unknown query parameter"}),
+        FakeResponse(200, COMPLETED),
+    )
+
+    assert (
+        client.wait_for_completion("run-1", _config(keystone_ci, timeout=5))
+        == COMPLETED
+    )
+    assert len(client.pool.requests) == 2
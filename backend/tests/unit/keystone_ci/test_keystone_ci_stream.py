@@ -0,0 +1,110 @@
+import io
+from types import ModuleType
+from typing import Any
+
+import pytest
+
+from tests.unit.keystone_ci.conftest import FakeResponse
+
+ijson = pytest.importorskip("ijson")
+
+SUMMARY = {
+    "status": "completed",
+    "total_tests": 2,
+    "passed_tests": 1,
+    "failed_tests": 1,
+    "run_url": "https://example.com/runs/1",
+}
+TESTS = [
+    {"name": "login", "status": "passed", "steps": [{"name": "open", "ok": True}]},
+    {
+        "name": "logout",
+        "status": "failed",
+        "error": {"message": "boom", "lines": [1, [2, 3]]},
+    },
+]
+
+
+def _stream(
+    keystone_ci: ModuleType, payload: dict[str, Any]
+) -> tuple[dict[str, Any], FakeResponse]:
+    client = keystone_ci.KeystoneCI("test-key", cache_dir=None)
+    response = FakeResponse(body=payload)
+    return client._stream_status(response), response
+
+
+def test_tests_after_summary_are_streamed(keystone_ci: ModuleType) -> None:
+    """With the summary first, tests stay lazy and the connection is held until consumed"""
+    data, response = _stream(keystone_ci, {**SUMMARY, "tests": TESTS, "trailer": "x"})
+
+    assert not isinstance(data["tests"], list)
+    assert not response.released
+    assert list(data["tests"]) == TESTS
+    assert data["trailer"] == "x"
+    assert response.released
+
+
+def test_tests_before_summary_are_materialized(keystone_ci: ModuleType) -> None:
+    """Summary fields after the test list force the list to be read eagerly"""
+    data, response = _stream(keystone_ci, {"tests": TESTS, **SUMMARY})
+
+    assert data["tests"] == TESTS
+    assert {key: data[key] for key in SUMMARY} == SUMMARY
+    assert response.released
+
+
+def test_nested_values_inside_tests(keystone_ci: ModuleType) -> None:
+    """Nested arrays and objects inside an entry don't end the tests array early"""
+    nested = [{"name": "a", "matrix": [[], [[]], {"x": []}]}, "plain", None, 7]
+    data, _ = _stream(keystone_ci, {**SUMMARY, "tests": nested, "after": [1]})
+
+    assert list(data["tests"]) == nested
+    assert data["after"] == [1]
+
+
+@pytest.mark.parametrize("summary_first", [True, False])
+def test_empty_tests_array(keystone_ci: ModuleType, summary_first: bool) -> None:
+    """An empty array is falsy and the remaining fields are still read"""
+    payload = {**SUMMARY, "tests": []} if summary_first else {"tests": [], **SUMMARY}
+    data, response = _stream(keystone_ci, payload)
+
+    assert data["tests"] == []
+    assert data["run_url"] == SUMMARY["run_url"]
+    assert response.released
+
+
+def test_null_tests(keystone_ci: ModuleType) -> None:
+    """`tests: null` is read like any other field"""
+    data, response = _stream(keystone_ci, {**SUMMARY, "tests": None})
+
+    assert data == {**SUMMARY, "tests": None}
+    assert response.released
+
+
+def test_read_fields_skips_nested_keys(keystone_ci: ModuleType) -> None:
+    """Only top-level keys are collected; a nested `tests` key is not the test list"""
+    events = ijson.parse(io.BytesIO(b'{"meta": {"tests": [1]}, "status": "running"}'))
+    data: dict[str, Any] = {}
+
+    assert keystone_ci._read_fields(events, data) is False
+    assert data == {"meta": {"tests": [1]}, "status": "running"}
+
+
+@pytest.mark.parametrize(
+    "headers,expected",
+    [
+        ({"Content-Length": str(300 * 1024)}, True),
+        ({"Content-Length": str(100 * 1024)}, False),
+        # A 1.5 MB body gzips to ~113 KB on the wire
+        ({"Content-Length": str(113 * 1024), "Content-Encoding": "gzip"}, True),
+        ({"Content-Length": "2048", "Content-Encoding": "gzip"}, False),
+        ({}, False),
+    ],
+)
+def test_is_large_accounts_for_compression(
+    keystone_ci: ModuleType, headers: dict[str, str], expected: bool
+) -> None:
+    """The stream threshold is compared against the decoded size, not the wire size"""
+    response = FakeResponse(headers=headers)
+
+    assert keystone_ci.KeystoneCI._is_large(response) is expected
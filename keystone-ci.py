@@ -4,15 +4,16 @@ Keystone CI - Command-line interface for running Keystone test suites in CI/CD p
 
 Usage:
   keystone-ci.py run --suite-id=<id> --base-url=<url> [--api-key=<key>] [--output=<format>] [--timeout=<seconds>] [--poll-interval=<seconds>] [--ci-run-id=<id>] [--branch=<name>] [--commit=<sha>]
-  keystone-ci.py status --suite-run-id=<id> [--api-key=<key>] [--output=<format>]
+  keystone-ci.py status (--suite-run-id=<id> | --suite-run-ids=<ids>) [--api-key=<key>] [--output=<format>]
   keystone-ci.py -h | --help
   keystone-ci.py --version
 
 Options:
   -h --help                Show this screen.
   --version                Show version.
-  --suite-id=<id>          Suite ID to run.
+  --suite-id=<id>          Suite ID to run (comma-separated to run several in parallel).
   --suite-run-id=<id>      Suite run ID to check status.
+  --suite-run-ids=<ids>    Comma-separated suite run IDs to check in parallel.
   --base-url=<url>         Base URL for test execution.
   --api-key=<key>          API key for authentication [default: env:KEYSTONE_API_KEY].
   --output=<format>        Output format: text, json, github [default: text].
@@ -23,206 +24,1060 @@ Options:
   --commit=<sha>           Commit SHA.
 """
 
+import argparse
+import hashlib
+import io
+import itertools
 import os
+import random
+import re
+import socket
 import sys
+import tempfile
 import time
+import uuid
 import json
-import requests
-from typing import Dict, Any, Optional
+import urllib3
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Dict, Any, Iterator, Optional, Tuple
+from urllib.parse import urlsplit
+from urllib.request import getproxies, proxy_bypass
+from urllib3.exceptions import MaxRetryError, ProtocolError, TimeoutError as Urllib3TimeoutError
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 
-# Try to import docopt, provide fallback if not available
+# Prefer orjson for (de)serialization when available, fall back to stdlib json
 try:
-    from docopt import docopt
+    import orjson
 except ImportError:
-    print("Error: docopt not installed. Please run: pip install docopt")
-    sys.exit(1)
+    orjson = None
+
+
+def _loads(raw: bytes) -> Any:
+    """Decode a JSON response body."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dumpb(obj: Any) -> bytes:
+    """Encode `obj` as a compact JSON request body."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode()
+
+
+def _dumps(obj: Any, pretty: bool = False) -> str:
+    """Encode `obj` as JSON, indented by two spaces when `pretty` is set."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0).decode()
+    return json.dumps(obj, indent=2 if pretty else None)
+
+
+# ijson lets large status bodies be printed while they are still arriving
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+def _parse_max_retries(raw: str) -> int:
+    """Parse KEYSTONE_MAX_RETRIES, using DEFAULT_MAX_RETRIES when it is empty."""
+    if not raw.strip():
+        return DEFAULT_MAX_RETRIES
+    message = f"KEYSTONE_MAX_RETRIES must be a non-negative integer, got {raw!r}"
+    try:
+        value = int(raw)
+    except ValueError:
+        raise ValueError(message) from None
+    if value < 0:
+        raise ValueError(message)
+    return value
+
+
+# Environment-derived configuration, read once at import
+DEFAULT_API_URL = os.environ.get('KEYSTONE_API_URL', 'https://api.withkeystone.com')
+DEBUG = os.environ.get('KEYSTONE_DEBUG', '').lower() in ('1', 'true', 'yes')
+# Kept as the raw string; main() validates it so a bad value can't break the import
+MAX_RETRIES_ENV = os.environ.get('KEYSTONE_MAX_RETRIES', '')
+DEFAULT_MAX_RETRIES = 3
+# Set KEYSTONE_CACHE_DIR to an empty string to disable the status cache
+CACHE_DIR = os.environ.get(
+    'KEYSTONE_CACHE_DIR',
+    os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'), 'keystone')
+)
+
+# Suite run statuses that end polling
+TERMINAL_STATUSES = frozenset(('completed', 'failed', 'aborted'))
+
+# (connect, read) timeouts for every API request
+REQUEST_TIMEOUT = (3.05, 30)
+
+# Network failures worth retrying from the poll loop
+TRANSIENT_ERRORS = (MaxRetryError, ProtocolError, Urllib3TimeoutError)
+
+# Error statuses that mean "try again later" rather than "give up"
+RETRYABLE_STATUSES = frozenset((429, 502, 503, 504))
+
+# Trigger answers that mean the run was not accepted, so retrying can't duplicate it
+TRIGGER_RETRY_STATUSES = frozenset((429, 503))
+
+# Longest Retry-After urllib3 may sleep out for requests with no deadline
+RETRY_AFTER_MAX = 10
+
+# Upper bound on suites handled in parallel by `run` and `status --suite-run-ids`
+MAX_CONCURRENT_RUNS = 8
+
+STATUS_LINE = "Status: %s | Tests: %s | Passed: %s | Failed: %s"
+
+# Print a progress line every this many status polls while waiting
+PROGRESS_EVERY = 6
+
+# Status bodies larger than this (decoded bytes) are stream-parsed for text output
+STREAM_THRESHOLD = 256 * 1024
+
+# Content-Length counts compressed bytes; JSON status bodies are assumed to
+# expand at least this much when gzip/br/zstd encoded (1.5 MB -> ~110 KB)
+ENCODED_EXPANSION = 8
+
+# Fields that make a payload usable as a status snapshot
+SUMMARY_FIELDS = ('status', 'total_tests', 'passed_tests', 'failed_tests')
+
+# Fields text output prints before the test list; streaming needs them first
+STREAM_HEADER_FIELDS = SUMMARY_FIELDS + ('run_url',)
+
+# Test result lines are written to stdout in batches of this size
+OUTPUT_BATCH_LINES = 100
+
+# TCP_NODELAY for the small request/response exchanges, plus TCP keepalive
+# probes so idle pooled connections survive NATs and proxies instead of
+# being dropped (which costs a fresh DNS lookup and handshake)
+SOCKET_OPTIONS = [
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+if hasattr(socket, 'TCP_KEEPIDLE'):
+    SOCKET_OPTIONS += [
+        (socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 30),
+        (socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 10),
+        (socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 3),
+    ]
+
+# Longest time (seconds) we ask the server to hold a status long-poll open
+LONG_POLL_WAIT = 25
+
+# Answers to `?wait=` from servers that don't support long-polling (FastAPI
+# validation rejects the unknown parameter with 422)
+LONG_POLL_UNSUPPORTED = frozenset((400, 422, 501))
+
+
+# Sentinel for an exhausted iterator (test entries may themselves be null)
+_END = object()
+
+
+def _build_value(events, event: str, value: Any) -> Any:
+    """Assemble the JSON value starting with (`event`, `value`) from ijson events."""
+    builder = ijson.ObjectBuilder()
+    builder.event(event, value)
+    depth = 1 if event in ('start_map', 'start_array') else 0
+    while depth:
+        _, event, value = next(events)
+        builder.event(event, value)
+        if event in ('start_map', 'start_array'):
+            depth += 1
+        elif event in ('end_map', 'end_array'):
+            depth -= 1
+    return builder.value
+
+
+def _read_fields(events, data: Dict[str, Any]) -> bool:
+    """Read top-level fields into `data` until the `tests` array or the end.
+    
+    Returns True if parsing stopped at the start of the `tests` array.
+    """
+    for prefix, event, value in events:
+        if prefix == '' and event == 'map_key':
+            key = value
+            _, event, value = next(events)
+            if key == 'tests' and event == 'start_array':
+                return True
+            data[key] = _build_value(events, event, value)
+    return False
+
+
+@dataclass(frozen=True, slots=True)
+class RunConfig:
+    """Validated settings for the `run` command."""
+    suite_ids: Tuple[str, ...]
+    base_url: str
+    timeout: int = 600
+    poll_interval: int = 5
+    ci_run_id: Optional[str] = None
+    branch: Optional[str] = None
+    commit: Optional[str] = None
+    output: str = 'text'
+    
+    def __post_init__(self):
+        if not self.suite_ids:
+            raise ValueError("--suite-id must name at least one suite")
+        if self.timeout <= 0:
+            raise ValueError("--timeout must be greater than 0")
+        if self.poll_interval < 1:
+            raise ValueError("--poll-interval must be at least 1 second")
+        if self.timeout < self.poll_interval:
+            raise ValueError("--timeout must be at least --poll-interval")
+    
+    @classmethod
+    def from_args(cls, args: argparse.Namespace) -> 'RunConfig':
+        return cls(
+            suite_ids=tuple(s.strip() for s in args.suite_id.split(',') if s.strip()),
+            base_url=args.base_url,
+            timeout=args.timeout,
+            poll_interval=args.poll_interval,
+            ci_run_id=args.ci_run_id,
+            branch=args.branch,
+            commit=args.commit,
+            output=args.output
+        )
+
+
+class StatusCache:
+    """On-disk cache of status responses, keyed by API key and URL.
+    
+    Terminal statuses never change, so they are served without a request.
+    Other entries are fresh for the server's Cache-Control max-age and are
+    then revalidated with their ETag (a 304 reuses the cached body).
+    """
+    
+    def __init__(self, directory: str, api_key: str = ''):
+        self.directory = directory
+        # Keys that can see different runs must never share entries
+        self.namespace = hashlib.sha256(api_key.encode()).hexdigest()
+    
+    def _path(self, url: str) -> str:
+        key = hashlib.sha256(f"{self.namespace}:{url}".encode()).hexdigest()
+        return os.path.join(self.directory, key + '.json')
+    
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._path(url), 'rb') as f:
+                entry = _loads(f.read())
+        except (OSError, ValueError):
+            return None
+        # Treat entries from other versions or damaged files as misses
+        if not (isinstance(entry, dict) and isinstance(entry.get('body'), dict)):
+            return None
+        return entry
+    
+    @staticmethod
+    def is_fresh(entry: Dict[str, Any]) -> bool:
+        return entry['body'].get('status') in TERMINAL_STATUSES or time.time() < entry.get('expires', 0)
+    
+    def put(self, url: str, headers, body: Dict[str, Any]):
+        """Store `body` if the response headers allow something to be reused."""
+        cache_control = headers.get('Cache-Control', '')
+        if 'no-store' in cache_control:
+            return
+        etag = headers.get('ETag')
+        max_age = re.search(r'max-age=(\d+)', cache_control)
+        if not (etag or max_age or body.get('status') in TERMINAL_STATUSES):
+            return
+        
+        entry = {
+            'etag': etag,
+            'expires': time.time() + int(max_age.group(1)) if max_age else 0,
+            'body': body
+        }
+        tmp_path = None
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # A unique temp file per writer, so threads and matrix jobs never share one
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(_dumpb(entry))
+            # Atomic so concurrent readers never see a half-written entry
+            os.replace(tmp_path, self._path(url))
+        except OSError:
+            if tmp_path is not None:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+
+
+class KeystoneAPIError(Exception):
+    """The Keystone API answered with an error status."""
+    
+    def __init__(self, status: int, body: str, retry_after: Optional[float] = None):
+        super().__init__(f"{status} - {body}")
+        self.status = status
+        self.body = body
+        self.retry_after = retry_after
+
+
+class CappedRetry(Retry):
+    """Retry that waits at most RETRY_AFTER_MAX seconds for a Retry-After.
+    
+    Older urllib3 releases have no `retry_after_max`, and newer ones
+    default it to six hours.
+    """
+    
+    def get_retry_after(self, response) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        return None if retry_after is None else min(retry_after, RETRY_AFTER_MAX)
 
 
 class KeystoneCI:
     """Keystone CI client for running test suites."""
     
-    def __init__(self, api_key: str, base_url: str = "https://api.withkeystone.com"):
+    def __init__(self, api_key: str, base_url: str = DEFAULT_API_URL, debug: bool = DEBUG,
+                 cache_dir: Optional[str] = CACHE_DIR, max_retries: int = DEFAULT_MAX_RETRIES):
         self.api_key = api_key
+        self.max_retries = max_retries
         self.base_url = base_url.rstrip('/')
         self.headers = {"X-API-Key": api_key}
-        self.debug = os.environ.get('KEYSTONE_DEBUG', '').lower() in ('1', 'true', 'yes')
+        self.debug = debug
+        self.cache = StatusCache(cache_dir, api_key) if cache_dir else None
+        
+        # Advertise every encoding urllib3 can decode here: br and zstd are
+        # added by its extras, pip install "urllib3[brotli,zstd]"
+        self.request_headers = {**self.headers, "Accept-Encoding": ACCEPT_ENCODING}
+        self._encoding_logged = False
+        
+        # Retrying the trigger after the request may have reached the backend
+        # (read errors, 502/504 from a gateway) could start duplicate runs, so
+        # urllib3 only retries connect errors; trigger_suite_run retries the
+        # explicit "not now" answers within the --timeout budget
+        self.trigger_retries = Retry(
+            total=max_retries,
+            read=0,
+            other=0,
+            backoff_factor=0.5,
+            allowed_methods=None,
+            respect_retry_after_header=False,
+            raise_on_status=False
+        )
+        
+        # Polls inside wait_for_completion must not sleep out a Retry-After
+        # inside urllib3, where the deadline can't see it: error statuses come
+        # straight back and the poll loop backs off within its deadline
+        self.poll_retries = Retry(
+            total=max_retries,
+            read=0,
+            status=0,
+            backoff_factor=0.5,
+            allowed_methods=["GET"],
+            respect_retry_after_header=False,
+            raise_on_status=False
+        )
+        
+        # Talk to urllib3 directly: one pool, so every poll rides the same
+        # keep-alive connection without requests' per-call overhead
+        pool_kwargs = dict(
+            num_pools=2,
+            maxsize=16,
+            headers=self.request_headers,
+            retries=CappedRetry(
+                total=max_retries,
+                backoff_factor=0.5,
+                status_forcelist=sorted(RETRYABLE_STATUSES),
+                # Only idempotent requests; the trigger POST uses trigger_retries
+                allowed_methods=["GET"],
+                respect_retry_after_header=True,
+                # Hand the last response back so _raise_for_status reports it
+                raise_on_status=False
+            ),
+            timeout=urllib3.Timeout(connect=REQUEST_TIMEOUT[0], read=REQUEST_TIMEOUT[1]),
+            socket_options=SOCKET_OPTIONS
+        )
+        # Honor HTTP(S)_PROXY / NO_PROXY like requests did
+        parts = urlsplit(self.base_url)
+        proxy_url = getproxies().get(parts.scheme)
+        if proxy_url and not proxy_bypass(parts.hostname or ''):
+            self.pool = urllib3.ProxyManager(proxy_url, **pool_kwargs)
+        else:
+            self.pool = urllib3.PoolManager(**pool_kwargs)
+        
+        if self.debug:
+            self._log_resolved_host()
+    
+    def _log_resolved_host(self):
+        """Resolve the API host once and report where it points."""
+        parts = urlsplit(self.base_url)
+        port = parts.port or (443 if parts.scheme == 'https' else 80)
+        try:
+            addresses = {info[4][0] for info in socket.getaddrinfo(parts.hostname, port, type=socket.SOCK_STREAM)}
+        except socket.gaierror as e:
+            print(f"🔍 Debug - Could not resolve {parts.hostname}: {e}")
+            return
+        print(f"🔍 Debug - {parts.hostname} resolves to {', '.join(sorted(addresses))}")
+    
+    def close(self):
+        """Release pooled connections."""
+        self.pool.clear()
+    
+    @staticmethod
+    def _raise_for_status(response: urllib3.HTTPResponse):
+        """Raise KeystoneAPIError for 4xx/5xx responses."""
+        if response.status >= 400:
+            raise KeystoneAPIError(response.status, response.data.decode('utf-8', 'replace'))
     
-    def trigger_suite_run(self, suite_id: str, test_base_url: str, 
-                         ci_run_id: Optional[str] = None,
-                         branch: Optional[str] = None,
-                         commit: Optional[str] = None) -> Dict[str, Any]:
-        """Trigger a suite run."""
+    @staticmethod
+    def _status_error(response: urllib3.HTTPResponse) -> KeystoneAPIError:
+        """Build the error for an unexpected status poll response.
+        
+        Only called off the hot path; the body is truncated for logging.
+        """
+        return KeystoneAPIError(response.status, response.data[:200].decode('utf-8', 'replace'),
+                                retry_after=KeystoneCI._retry_after(response, None))
+    
+    def _log_encoding(self, response: urllib3.HTTPResponse):
+        """In debug mode, report the negotiated Content-Encoding once."""
+        if self.debug and not self._encoding_logged:
+            self._encoding_logged = True
+            print(f"🔍 Debug - Content-Encoding: {response.headers.get('Content-Encoding', 'identity')}")
+    
+    def trigger_suite_run(self, suite_id: str, config: RunConfig,
+                          label: Optional[str] = None) -> Dict[str, Any]:
+        """Trigger a run of `suite_id` with the settings in `config`.
+        
+        `label` prefixes the printed lines so concurrent triggers can be told apart.
+        """
         url = f"{self.base_url}/api/v1/suites/{suite_id}/ci/trigger"
         
         payload = {
-            "base_url": test_base_url,
-            "ci_run_id": ci_run_id,
-            "branch": branch,
-            "commit": commit
+            "base_url": config.base_url,
+            "ci_run_id": config.ci_run_id,
+            "branch": config.branch,
+            "commit": config.commit
         }
         
         # Remove None values
         payload = {k: v for k, v in payload.items() if v is not None}
         
-        print(f"🚀 Triggering suite run...")
-        print(f"   URL: {url}")
-        print(f"   Payload: {json.dumps(payload, indent=2)}")
+        commit = config.commit
+        prefix = f"[{label}] " if label else ""
+        print(f"{prefix}🚀 Trigger suite={suite_id} base={config.base_url} branch={config.branch or '-'} commit={commit[:8] if commit else '-'}")
+        if self.debug:
+            print(f"{prefix}🔍 Debug - URL: {url}")
+            print(f"{prefix}🔍 Debug - Payload: {_dumps(payload, pretty=True)}")
         
-        response = requests.post(url, json=payload, headers=self.headers)
-        response.raise_for_status()
+        deadline = time.monotonic() + config.timeout
+        delay = 0.5
+        for attempt in range(self.max_retries + 1):
+            response = self.pool.request('POST', url, body=_dumpb(payload),
+                                         headers={**self.request_headers, "Content-Type": "application/json"},
+                                         retries=self.trigger_retries)
+            if response.status not in TRIGGER_RETRY_STATUSES or attempt == self.max_retries:
+                break
+            # Honor the server's Retry-After, but never past the deadline
+            pause = self._retry_after(response, None)
+            pause = delay if pause is None else pause
+            if time.monotonic() + pause > deadline:
+                break
+            print(f"{prefix}⚠️  Trigger answered HTTP {response.status}, retrying in {pause:g}s...", flush=True)
+            time.sleep(pause)
+            delay *= 2
+        self._raise_for_status(response)
         
-        result = response.json()
-        print(f"✅ Suite run triggered successfully!")
-        print(f"   Suite Run ID: {result.get('suite_run_id')}")
-        print(f"   Poll URL: {result.get('poll_url')}")
-        print(f"   Run URL: {result.get('run_url')}")
+        result = _loads(response.data)
+        print(f"{prefix}✅ Suite run triggered successfully!")
+        print(f"{prefix}   Suite Run ID: {result.get('suite_run_id')}")
+        print(f"{prefix}   Poll URL: {result.get('poll_url')}")
+        print(f"{prefix}   Run URL: {result.get('run_url')}")
         
         if self.debug:
-            print(f"\n🔍 Debug - Raw response:")
-            print(json.dumps(result, indent=2))
+            print(f"\n{prefix}🔍 Debug - Raw response:")
+            print(_dumps(result, pretty=True))
         
         return result
     
-    def get_suite_run_status(self, suite_run_id: str) -> Dict[str, Any]:
-        """Get status of a suite run."""
-        url = f"{self.base_url}/api/v1/suites/ci/{suite_run_id}/status"
+    def get_suite_run_status(self, suite_run_id: str,
+                             label: Optional[str] = None,
+                             quiet: bool = False,
+                             stream_tests: bool = False) -> Dict[str, Any]:
+        """Get status of a suite run, printing it unless `quiet` is set.
+        
+        With `stream_tests`, bodies larger than STREAM_THRESHOLD are parsed
+        incrementally and `tests` is returned as an iterator that yields each
+        test as it is received (requires ijson).
+        """
+        return self._get_status_by_url(self._status_url(suite_run_id), label, quiet, stream_tests)
+    
+    def _status_url(self, suite_run_id: str) -> str:
+        return f"{self.base_url}/api/v1/suites/ci/{suite_run_id}/status"
+    
+    def _get_status_by_url(self, url: str, label: Optional[str] = None,
+                           quiet: bool = False,
+                           stream_tests: bool = False,
+                           retries: Optional[Retry] = None) -> Dict[str, Any]:
+        """Fetch a status payload from an already-built status URL.
+        
+        `retries` overrides the pool's retry policy for this request.
+        """
+        data = self._fetch_status(url, stream_tests and ijson is not None, retries)
+        if not quiet:
+            self._print_status(data, label)
+        return data
+    
+    def _fetch_status(self, url: str, stream: bool,
+                      retries: Optional[Retry] = None) -> Dict[str, Any]:
+        """GET a status payload, going through the status cache when enabled."""
+        entry = self.cache.get(url) if self.cache is not None else None
+        if entry is not None and StatusCache.is_fresh(entry):
+            if self.debug:
+                print("🔍 Debug - Status served from cache")
+            return entry['body']
+        
+        headers = None
+        if entry is not None and entry.get('etag'):
+            headers = {**self.request_headers, "If-None-Match": entry['etag']}
         
-        response = requests.get(url, headers=self.headers)
-        response.raise_for_status()
+        response = self.pool.request('GET', url, headers=headers, preload_content=not stream,
+                                     retries=retries)
+        status_code = response.status
+        if status_code == 200 and stream and self._is_large(response):
+            # Streamed bodies are never fully in memory, so they aren't cached
+            self._log_encoding(response)
+            return self._stream_status(response)
         
-        data = response.json()
-        print(f"📊 Status: {data.get('status', 'unknown')} | Tests: {data.get('total_tests', 0)} | Passed: {data.get('passed_tests', 0)} | Failed: {data.get('failed_tests', 0)}")
+        try:
+            if status_code == 304 and entry is not None:
+                data = entry['body']
+            elif status_code != 200:
+                raise self._status_error(response)
+            else:
+                self._log_encoding(response)
+                data = _loads(response.data)
+        finally:
+            response.release_conn()
+        
+        if self.cache is not None:
+            self.cache.put(url, response.headers, data)
+        return data
+    
+    @staticmethod
+    def _is_large(response: urllib3.HTTPResponse) -> bool:
+        """Estimate whether the decoded body is larger than STREAM_THRESHOLD."""
+        size = int(response.headers.get('Content-Length', 0))
+        if response.headers.get('Content-Encoding', 'identity') != 'identity':
+            size *= ENCODED_EXPANSION
+        return size > STREAM_THRESHOLD
+    
+    def _stream_status(self, response: urllib3.HTTPResponse) -> Dict[str, Any]:
+        """Incrementally parse a status body, leaving `tests` as an iterator."""
+        events = ijson.parse(response, use_float=True)
+        data: Dict[str, Any] = {}
+        
+        if not _read_fields(events, data):
+            response.release_conn()
+            return data
+        
+        tests = self._iter_tests(events, data, response)
+        if all(key in data for key in STREAM_HEADER_FIELDS):
+            # Peek so an empty array stays falsy, as it is when not streamed
+            first = next(tests, _END)
+            data['tests'] = [] if first is _END else itertools.chain((first,), tests)
+        else:
+            # Summary fields come after the test list; nothing to gain by streaming
+            data['tests'] = list(tests)
+        return data
+    
+    @staticmethod
+    def _iter_tests(events, data: Dict[str, Any],
+                    response: urllib3.HTTPResponse) -> Iterator[Dict[str, Any]]:
+        """Yield entries of the `tests` array, then read the remaining fields."""
+        try:
+            for _, event, value in events:
+                if event == 'end_array':
+                    break
+                yield _build_value(events, event, value)
+            _read_fields(events, data)
+        finally:
+            response.release_conn()
+    
+    @staticmethod
+    def _status_line(data: Dict[str, Any]) -> str:
+        return STATUS_LINE % (data.get('status', 'unknown'), data.get('total_tests', 0),
+                              data.get('passed_tests', 0), data.get('failed_tests', 0))
+    
+    def _print_status(self, data: Dict[str, Any], label: Optional[str] = None):
+        """Print a one-line status summary (and raw payload in debug mode)."""
+        prefix = f"[{label}] " if label else ""
+        print(f"{prefix}📊 {self._status_line(data)}")
         
         if self.debug:
             print(f"🔍 Debug - Raw status response:")
-            print(json.dumps(data, indent=2))
+            print(_dumps(data, pretty=True))
+    
+    def _long_poll_status(self, url: str, wait: int,
+                          etag: Optional[str] = None) -> Optional[urllib3.HTTPResponse]:
+        """Ask the server to hold the status request until the run changes.
         
-        return data
+        Returns the response (200 for a new state, 304 when nothing changed
+        within `wait` seconds), or None if the server rejects long-polling.
+        """
+        headers = {**self.request_headers, "If-None-Match": etag} if etag else None
+        
+        response = self.pool.request('GET', url, fields={"wait": wait}, headers=headers,
+                                     timeout=urllib3.Timeout(connect=REQUEST_TIMEOUT[0],
+                                                             read=wait + REQUEST_TIMEOUT[1]),
+                                     retries=self.poll_retries)
+        status_code = response.status
+        if status_code == 200:
+            self._log_encoding(response)
+        elif status_code in LONG_POLL_UNSUPPORTED:
+            return None
+        elif status_code != 304:
+            raise self._status_error(response)
+        return response
     
-    def wait_for_completion(self, suite_run_id: str, timeout: int = 600, 
-                           poll_interval: int = 5) -> Dict[str, Any]:
-        """Poll for suite run completion."""
-        start_time = time.time()
+    @staticmethod
+    def _retry_after(response: Optional[urllib3.HTTPResponse],
+                     data: Optional[Dict[str, Any]]) -> Optional[float]:
+        """Return the server's advisory poll delay, if it sent one."""
+        hint = response.headers.get('Retry-After') if response is not None else None
+        if hint is None and data is not None:
+            hint = data.get('retry_after')
+        try:
+            return max(0.0, float(hint)) if hint is not None else None
+        except (TypeError, ValueError):
+            return None
+    
+    def wait_for_completion(self, suite_run_id: str, config: RunConfig,
+                            label: Optional[str] = None,
+                            initial_status: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Poll for suite run completion.
+        
+        Long-polls the status endpoint when the server supports it and falls
+        back to interval polling otherwise. The delay between polls starts
+        short and backs off (with jitter) up to `config.poll_interval`, unless the
+        server sends a Retry-After hint. Progress is printed every
+        PROGRESS_EVERY polls; `label` prefixes those lines so concurrent
+        waits can be told apart.
         
-        print(f"⏳ Waiting for suite run to complete (timeout: {timeout}s, poll interval: {poll_interval}s)...")
+        If `initial_status` (e.g. the trigger response) already carries a
+        status snapshot, it stands in for the first poll.
+        """
+        timeout = config.timeout
+        poll_interval = config.poll_interval
+        start_time = time.monotonic()
+        deadline = start_time + timeout
+        status_url = self._status_url(suite_run_id)
+        prefix = f"[{label}] " if label else ""
+        delay = min(0.5, poll_interval)
+        long_poll = True
+        etag = None
+        status = None
+        polls = 0
+        if initial_status is not None and not all(key in initial_status for key in SUMMARY_FIELDS):
+            initial_status = None
         
-        while time.time() - start_time < timeout:
-            status = self.get_suite_run_status(suite_run_id)
+        print(f"{prefix}⏳ Waiting for suite run to complete (timeout: {timeout}s, poll interval: {poll_interval}s)...", flush=True)
+        
+        while time.monotonic() < deadline:
+            request_start = time.monotonic()
+            response = None
+            data = None
+            
+            try:
+                if initial_status is not None:
+                    data, initial_status = initial_status, None
+                elif long_poll:
+                    remaining = deadline - request_start
+                    response = self._long_poll_status(status_url, max(1, min(LONG_POLL_WAIT, int(remaining))), etag)
+                    if response is None:
+                        if self.debug:
+                            print(f"{prefix}🔍 Debug - Long-polling not supported, falling back to interval polling")
+                        long_poll = False
+                        continue
+                    if response.status == 200:
+                        etag = response.headers.get('ETag')
+                        data = _loads(response.data)
+                else:
+                    data = self._get_status_by_url(status_url, quiet=True, retries=self.poll_retries)
+            except (KeystoneAPIError, *TRANSIENT_ERRORS) as e:
+                # Transient network trouble or a "try again later" status:
+                # keep polling on the backoff schedule, within the deadline
+                if isinstance(e, KeystoneAPIError):
+                    if e.status not in RETRYABLE_STATUSES:
+                        raise
+                    reason, pause = f"HTTP {e.status}", e.retry_after
+                else:
+                    reason, pause = (getattr(e, 'reason', None) or e).__class__.__name__, None
+                print(f"{prefix}⚠️  Status poll failed ({reason}), retrying...", flush=True)
+                time.sleep(min(delay if pause is None else pause,
+                               max(0.0, deadline - time.monotonic())))
+                delay = min(poll_interval, delay * 1.5) + random.uniform(0, 0.25)
+                continue
             
-            if status['status'] in ['completed', 'failed', 'aborted']:
-                elapsed = int(time.time() - start_time)
-                print(f"✅ Suite run finished in {elapsed}s with status: {status['status']}")
+            if data is not None:
+                status = data
+            if status is not None and status['status'] in TERMINAL_STATUSES:
+                elapsed = int(time.monotonic() - start_time)
+                print(f"{prefix}✅ Suite run finished in {elapsed}s | {self._status_line(status)}", flush=True)
+                if self.debug:
+                    print(f"{prefix}🔍 Debug - Raw status response:")
+                    print(_dumps(status, pretty=True))
                 return status
             
-            time.sleep(poll_interval)
+            if status is not None and polls % PROGRESS_EVERY == 0:
+                elapsed = int(time.monotonic() - start_time)
+                print(f"{prefix}📊 {self._status_line(status)} ({elapsed}s)", flush=True)
+            polls += 1
+            
+            retry_after = self._retry_after(response, data)
+            if retry_after is not None:
+                time.sleep(min(retry_after, max(0.0, deadline - time.monotonic())))
+            else:
+                # Servers that ignore `wait` answer immediately; don't hammer them
+                time.sleep(min(max(0.0, delay - (time.monotonic() - request_start)),
+                               max(0.0, deadline - time.monotonic())))
+                delay = min(poll_interval, delay * 1.5) + random.uniform(0, 0.25)
         
         raise TimeoutError(f"Suite run did not complete within {timeout} seconds")
 
 
-def format_output(data: Dict[str, Any], format_type: str, suite_run_id: Optional[str] = None):
-    """Format output based on requested format."""
+def _write_lines(lines):
+    """Write `lines` to stdout with a single write call."""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+def write_github_outputs(outputs: Dict[str, Any]):
+    """Append step outputs to $GITHUB_OUTPUT in a single write.
+    
+    Multiline values use GitHub's heredoc syntax. Outside of Actions (no
+    GITHUB_OUTPUT) the same lines are written to stdout.
+    """
+    buf = io.StringIO()
+    for key, value in outputs.items():
+        value = str(value)
+        if '\n' in value:
+            delimiter = f"ghadelimiter_{uuid.uuid4().hex}"
+            buf.write(f"{key}<<{delimiter}\n{value}\n{delimiter}\n")
+        else:
+            buf.write(f"{key}={value}\n")
+    
+    output_path = os.environ.get('GITHUB_OUTPUT')
+    if output_path:
+        with open(output_path, 'a', buffering=8192, encoding='utf-8') as f:
+            f.write(buf.getvalue())
+    else:
+        sys.stdout.write(buf.getvalue())
+
+
+def write_github_step_summary(data: Dict[str, Any], suite_run_id: Optional[str] = None) -> bool:
+    """Append a Markdown report of the run to $GITHUB_STEP_SUMMARY in one write.
+    
+    Returns False (and writes nothing) when not running under GitHub Actions.
+    """
+    summary_path = os.environ.get('GITHUB_STEP_SUMMARY')
+    if not summary_path:
+        return False
+    
+    passed = data['status'] == 'completed' and data['failed_tests'] == 0
+    title = f"Keystone suite run `{suite_run_id}`" if suite_run_id else "Keystone suite run"
+    lines = [
+        f"### {'✅' if passed else '❌'} {title}: {data['status']}",
+        "",
+        "| Total | Passed | Failed |",
+        "| ---: | ---: | ---: |",
+        f"| {data['total_tests']} | {data['passed_tests']} | {data['failed_tests']} |",
+        "",
+    ]
+    if data.get('run_url'):
+        lines += [f"[View results]({data['run_url']})", ""]
+    if data.get('tests'):
+        lines += ["| | Test | Status | Duration |", "| --- | --- | --- | ---: |"]
+        for test in data['tests']:
+            status_icon = "✅" if test['status'] == 'completed' else "❌"
+            name = str(test['test_name']).replace('|', '\\|')
+            lines.append(f"| {status_icon} | {name} | {test['status']} | {test['duration_ms']}ms |")
+        lines.append("")
+    
+    with open(summary_path, 'a', buffering=16384, encoding='utf-8') as f:
+        f.write("\n".join(lines) + "\n")
+    return True
+
+
+def format_output(data: Dict[str, Any], format_type: str, suite_run_id: Optional[str] = None,
+                  show_summary: bool = True):
+    """Format output based on requested format.
+    
+    `show_summary=False` drops the status/totals block from text output when
+    the caller has already printed it.
+    """
     if format_type == 'json':
-        print(json.dumps(data, indent=2))
+        print(_dumps(data, pretty=True))
     
     elif format_type == 'github':
         # Set GitHub Actions outputs
+        outputs = {}
         if suite_run_id:
-            print(f"::set-output name=suite_run_id::{suite_run_id}")
-        print(f"::set-output name=status::{data['status']}")
-        print(f"::set-output name=passed_tests::{data['passed_tests']}")
-        print(f"::set-output name=failed_tests::{data['failed_tests']}")
-        print(f"::set-output name=total_tests::{data['total_tests']}")
-        print(f"::set-output name=run_url::{data.get('run_url', '')}")
+            outputs['suite_run_id'] = suite_run_id
+        outputs['status'] = data['status']
+        outputs['passed_tests'] = data['passed_tests']
+        outputs['failed_tests'] = data['failed_tests']
+        outputs['total_tests'] = data['total_tests']
+        outputs['run_url'] = data.get('run_url', '')
+        write_github_outputs(outputs)
+        write_github_step_summary(data, suite_run_id)
         
         # Also print summary
         if data['failed_tests'] > 0:
             print(f"\n❌ Tests failed: {data['failed_tests']} out of {data['total_tests']}")
-            sys.exit(1)
         else:
             print(f"\n✅ All {data['total_tests']} tests passed!")
     
     else:  # text format
-        print(f"\nSuite Run Status: {data['status']}")
-        print(f"Total Tests: {data['total_tests']}")
-        print(f"Passed: {data['passed_tests']}")
-        print(f"Failed: {data['failed_tests']}")
+        if show_summary:
+            print(f"\nSuite Run Status: {data['status']}")
+            print(f"Total Tests: {data['total_tests']}")
+            print(f"Passed: {data['passed_tests']}")
+            print(f"Failed: {data['failed_tests']}")
         
         if data.get('run_url'):
             print(f"\nView results: {data['run_url']}")
         
+        # Under GitHub Actions the per-test table goes to the job summary
+        if write_github_step_summary(data, suite_run_id):
+            print("\nTest results written to the job summary.")
+        
         # Show individual test results
-        if data.get('tests'):
+        elif data.get('tests'):
             print("\nTest Results:")
             print("-" * 60)
+            lines = []
             for test in data['tests']:
                 status_icon = "✅" if test['status'] == 'completed' else "❌"
-                print(f"{status_icon} {test['test_name']}: {test['status']} ({test['duration_ms']}ms)")
+                lines.append(f"{status_icon} {test['test_name']}: {test['status']} ({test['duration_ms']}ms)")
+                if len(lines) >= OUTPUT_BATCH_LINES:
+                    _write_lines(lines)
+                    lines.clear()
+            _write_lines(lines)
+
+
+def format_batch_output(statuses: Dict[str, Dict[str, Any]], format_type: str,
+                        show_summary: bool = True):
+    """Format the statuses of several suite runs (keyed by suite run ID).
+    
+    Step outputs are aggregated so GitHub doesn't keep only the last run's
+    values; `show_summary` is passed through to each text block. A run whose
+    status couldn't be fetched is given as `{'status': 'error', 'error': ...}`.
+    """
+    if format_type == 'json':
+        print(_dumps(statuses, pretty=True))
+    
+    elif format_type == 'github':
+        # One set of step outputs covering every run
+        distinct = {data.get('status') for data in statuses.values()}
+        failed_tests = sum(data.get('failed_tests') or 0 for data in statuses.values())
+        total_tests = sum(data.get('total_tests') or 0 for data in statuses.values())
+        write_github_outputs({
+            'suite_run_ids': ','.join(statuses),
+            'status': distinct.pop() if len(distinct) == 1 else 'mixed',
+            'passed_tests': sum(data.get('passed_tests') or 0 for data in statuses.values()),
+            'failed_tests': failed_tests,
+            'total_tests': total_tests,
+            # Per-run summaries; test lists are left to the job summary
+            'results': _dumps({
+                suite_run_id: {k: v for k, v in data.items() if k != 'tests'}
+                for suite_run_id, data in statuses.items()
+            }, pretty=True)
+        })
+        for suite_run_id, data in statuses.items():
+            if 'error' in data:
+                print(f"[{suite_run_id}] {data['error']}")
+            else:
+                write_github_step_summary(data, suite_run_id)
+        
+        # Errored and still-running suite runs have no final result yet
+        unfinished = [suite_run_id for suite_run_id, data in statuses.items()
+                      if data.get('status') not in TERMINAL_STATUSES]
+        if failed_tests > 0:
+            print(f"\n❌ Tests failed: {failed_tests} out of {total_tests} across {len(statuses)} suite runs")
+        elif unfinished:
+            print(f"\n⏳ {len(unfinished)} of {len(statuses)} suite runs have no final result: {', '.join(unfinished)}")
+        else:
+            print(f"\n✅ All {total_tests} tests passed across {len(statuses)} suite runs!")
+    
+    else:  # text format
+        for suite_run_id, data in statuses.items():
+            print(f"\n=== Suite run {suite_run_id} ===")
+            if 'error' in data:
+                print(data['error'])
+            else:
+                format_output(data, format_type, suite_run_id, show_summary=show_summary)
+
+
+def _error_message(e: Exception) -> str:
+    """Describe a failed command the way the CLI reports it."""
+    if isinstance(e, KeystoneAPIError):
+        return f"API Error: {e.status} - {e.body}"
+    if isinstance(e, TimeoutError):
+        return f"Timeout: {e}"
+    return f"Error: {e}"
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser (mirrors the usage in the module docstring)."""
+    parser = argparse.ArgumentParser(
+        prog='keystone-ci.py',
+        description="Command-line interface for running Keystone test suites in CI/CD pipelines."
+    )
+    parser.add_argument('--version', action='version', version='Keystone CI 1.0.0')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    
+    def add_common_options(subparser: argparse.ArgumentParser):
+        subparser.add_argument('--api-key', default='env:KEYSTONE_API_KEY', metavar='<key>',
+                               help="API key for authentication [default: env:KEYSTONE_API_KEY].")
+        subparser.add_argument('--output', default='text', choices=('text', 'json', 'github'),
+                               help="Output format [default: text].")
+    
+    run_parser = subparsers.add_parser('run', help="Trigger a suite run and wait for it to finish.")
+    run_parser.add_argument('--suite-id', required=True, metavar='<id>',
+                            help="Suite ID to run (comma-separated to run several in parallel).")
+    run_parser.add_argument('--base-url', required=True, metavar='<url>',
+                            help="Base URL for test execution.")
+    add_common_options(run_parser)
+    run_parser.add_argument('--timeout', type=int, default=600, metavar='<seconds>',
+                            help="Maximum time to wait for tests [default: 600].")
+    run_parser.add_argument('--poll-interval', type=int, default=5, metavar='<sec>',
+                            help="Polling interval in seconds [default: 5].")
+    run_parser.add_argument('--ci-run-id', metavar='<id>', help="CI run identifier.")
+    run_parser.add_argument('--branch', metavar='<name>', help="Branch name.")
+    run_parser.add_argument('--commit', metavar='<sha>', help="Commit SHA.")
+    
+    status_parser = subparsers.add_parser('status', help="Check the status of a suite run.")
+    run_ids = status_parser.add_mutually_exclusive_group(required=True)
+    run_ids.add_argument('--suite-run-id', metavar='<id>',
+                         help="Suite run ID to check status.")
+    run_ids.add_argument('--suite-run-ids', metavar='<ids>',
+                         help="Comma-separated suite run IDs to check in parallel.")
+    add_common_options(status_parser)
+    
+    return parser
 
 
 def main():
     """Main CLI entry point."""
-    arguments = docopt(__doc__, version='Keystone CI 1.0.0')
+    parser = build_parser()
+    args = parser.parse_args()
+    
+    try:
+        max_retries = _parse_max_retries(MAX_RETRIES_ENV)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    
+    config = None
+    if args.command == 'run':
+        try:
+            config = RunConfig.from_args(args)
+        except ValueError as e:
+            parser.error(str(e))
     
     # Get API key from environment or argument
-    api_key = arguments['--api-key']
+    api_key = args.api_key
     if api_key == 'env:KEYSTONE_API_KEY':
         api_key = os.environ.get('KEYSTONE_API_KEY')
         if not api_key:
             print("Error: KEYSTONE_API_KEY environment variable not set")
             sys.exit(1)
     
-    # Determine API base URL
-    api_base_url = os.environ.get('KEYSTONE_API_URL', 'https://api.withkeystone.com')
-    
-    client = KeystoneCI(api_key, api_base_url)
+    client = KeystoneCI(api_key, DEFAULT_API_URL, max_retries=max_retries)
     
     try:
-        if arguments['run']:
-            # Trigger suite run
-            print(f"Triggering suite {arguments['--suite-id']}...")
-            result = client.trigger_suite_run(
-                suite_id=arguments['--suite-id'],
-                test_base_url=arguments['--base-url'],
-                ci_run_id=arguments.get('--ci-run-id'),
-                branch=arguments.get('--branch'),
-                commit=arguments.get('--commit')
-            )
-            
-            suite_run_id = result['suite_run_id']
-            print(f"Suite run started: {suite_run_id}")
+        if config is not None:
+            multiple = len(config.suite_ids) > 1
             
-            # Wait for completion
-            timeout = int(arguments['--timeout'])
-            poll_interval = int(arguments['--poll-interval'])
+            def run_suite(suite_id: str):
+                # Trigger suite run
+                prefix = f"[{suite_id}] " if multiple else ""
+                result = client.trigger_suite_run(suite_id, config, suite_id if multiple else None)
+                
+                suite_run_id = result['suite_run_id']
+                print(f"{prefix}Suite run started: {suite_run_id}")
+                
+                # Wait for completion
+                print(f"{prefix}Polling for results (timeout: {config.timeout}s)...")
+                label = suite_run_id if multiple else None
+                # The trigger response may already include a status snapshot
+                return suite_run_id, client.wait_for_completion(suite_run_id, config, label,
+                                                                initial_status=result)
             
-            print(f"Polling for results (timeout: {timeout}s)...")
-            final_status = client.wait_for_completion(suite_run_id, timeout, poll_interval)
+            if not multiple:
+                suite_run_id, final_status = run_suite(config.suite_ids[0])
+                # Format output (wait_for_completion already printed the final totals)
+                format_output(final_status, config.output, suite_run_id, show_summary=False)
+                if (final_status.get('failed_tests') or 0) > 0:
+                    sys.exit(1)
+            else:
+                # Waits share the client's connection pool, so N suites poll over
+                # a handful of keep-alive connections. One failing suite must not
+                # discard the others, so errors are collected per suite
+                results = {}
+                errors = {}
+                with ThreadPoolExecutor(max_workers=min(len(config.suite_ids), MAX_CONCURRENT_RUNS)) as executor:
+                    futures = {executor.submit(run_suite, suite_id): suite_id for suite_id in config.suite_ids}
+                    for future in as_completed(futures):
+                        suite_id = futures[future]
+                        try:
+                            results[suite_id] = future.result()
+                        except Exception as e:
+                            errors[suite_id] = _error_message(e)
+                            print(f"[{suite_id}] {errors[suite_id]}", flush=True)
+                
+                runs = dict(results[suite_id] for suite_id in config.suite_ids if suite_id in results)
+                if runs:
+                    format_batch_output(runs, config.output, show_summary=False)
+                if errors:
+                    print(f"\n❌ {len(errors)} of {len(config.suite_ids)} suites did not finish: {', '.join(errors)}")
+                
+                # Exit with error if any suite errored or tests failed
+                if errors or any((final_status.get('failed_tests') or 0) > 0 for final_status in runs.values()):
+                    sys.exit(1)
+        
+        elif args.suite_run_ids is not None:
+            # Check several statuses at once over the shared connection pool
+            # The IDs key the batch output, so repeats are fetched once
+            suite_run_ids = list(dict.fromkeys(s.strip() for s in args.suite_run_ids.split(',') if s.strip()))
+            if not suite_run_ids:
+                print("Error: --suite-run-ids must name at least one suite run")
+                sys.exit(1)
+            def fetch_status(suite_run_id: str) -> Dict[str, Any]:
+                # One bad ID (e.g. a typo'd 404) must not discard the other results
+                try:
+                    return client.get_suite_run_status(suite_run_id, quiet=True)
+                except Exception as e:
+                    return {'status': 'error', 'error': _error_message(e)}
             
-            # Format output
-            format_output(final_status, arguments['--output'], suite_run_id)
+            with ThreadPoolExecutor(max_workers=min(len(suite_run_ids), MAX_CONCURRENT_RUNS)) as executor:
+                statuses = dict(zip(suite_run_ids, executor.map(fetch_status, suite_run_ids)))
+            format_batch_output(statuses, args.output)
             
-            # Exit with error if tests failed
-            if final_status['failed_tests'] > 0:
+            # Exit with error if any of them errored or failed
+            if any(status['status'] in ('error', 'failed') or (status.get('failed_tests') or 0) > 0
+                   for status in statuses.values()):
                 sys.exit(1)
         
-        elif arguments['status']:
+        else:
             # Check status only
-            status = client.get_suite_run_status(arguments['--suite-run-id'])
-            format_output(status, arguments['--output'])
+            status = client.get_suite_run_status(args.suite_run_id, quiet=True,
+                                                 stream_tests=args.output == 'text')
+            format_output(status, args.output)
             
             # Exit with error if tests failed
             if status['status'] == 'failed' or status['failed_tests'] > 0:
                 sys.exit(1)
     
-    except requests.exceptions.HTTPError as e:
-        print(f"API Error: {e.response.status_code} - {e.response.text}")
-        sys.exit(1)
-    except TimeoutError as e:
-        print(f"Timeout: {e}")
-        sys.exit(1)
     except Exception as e:
-        print(f"Error: {e}")
+        print(_error_message(e))
         sys.exit(1)
+    finally:
+        client.close()
 
 
 if __name__ == '__main__':